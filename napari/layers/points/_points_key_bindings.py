@@ -46,12 +46,14 @@ def activate_points_select_mode(layer: Points) -> None:
     layer.mode = Mode.SELECT
 
 
-points_fun_to_mode = [
-    (activate_points_pan_zoom_mode, Mode.PAN_ZOOM),
-    (activate_points_transform_mode, Mode.TRANSFORM),
-    (activate_points_add_mode, Mode.ADD),
-    (activate_points_select_mode, Mode.SELECT),
-]
+points_mode_to_fun: dict[Mode, Callable[[Points], None]] = {
+    Mode.PAN_ZOOM: activate_points_pan_zoom_mode,
+    Mode.TRANSFORM: activate_points_transform_mode,
+    Mode.ADD: activate_points_add_mode,
+    Mode.SELECT: activate_points_select_mode,
+}
+
+points_fun_to_mode = [(fun, mode) for mode, fun in points_mode_to_fun.items()]
 
 
 @Points.bind_key(KeyMod.CtrlCmd | KeyCode.KeyC, overwrite=True)
@@ -70,27 +72,31 @@ def paste(layer: Points) -> None:
     trans._('Select/Deselect all points in the current view slice'),
 )
 def select_all_in_slice(layer: Points) -> None:
-    new_selected = set(layer._indices_view[: len(layer._view_data)])
+    new_selected = set(layer._indices_view[: len(layer._view_data)].tolist())
+    selected_data = layer.selected_data
 
     # If all visible points are already selected, deselect the visible points
-    if new_selected & layer.selected_data == new_selected:
-        layer.selected_data = layer.selected_data - new_selected
+    if new_selected.issubset(selected_data):
+        layer.selected_data = selected_data - new_selected
+        n_total = len(layer.selected_data)
         show_info(
             trans._(
                 'Deselected all points in this slice, use Shift-A to deselect all points on the layer. ({n_total} selected)',
-                n_total=len(layer.selected_data),
+                n_total=n_total,
                 deferred=True,
             )
         )
 
     # If not all visible points are already selected, additionally select the visible points
     else:
-        layer.selected_data = layer.selected_data | new_selected
+        n_new = len(new_selected)
+        layer.selected_data = selected_data | new_selected
+        n_total = len(layer.selected_data)
         show_info(
             trans._(
                 'Selected {n_new} points in this slice, use Shift-A to select all points on the layer. ({n_total} selected)',
-                n_new=len(new_selected),
-                n_total=len(layer.selected_data),
+                n_new=n_new,
+                n_total=n_total,
                 deferred=True,
             )
         )
@@ -100,23 +106,27 @@ def select_all_in_slice(layer: Points) -> None:
     trans._('Select/Deselect all points in the layer'),
 )
 def select_all_data(layer: Points) -> None:
+    n_data = len(layer.data)
+
     # If all points are already selected, deselect all points
-    if len(layer.selected_data) == len(layer.data):
+    if len(layer.selected_data) == n_data:
         layer.selected_data = set()
         show_info(trans._('Cleared all selections.', deferred=True))
 
     # Select all points
     else:
-        new_selected = set(range(layer.data.shape[0]))
-        # Needed for the notification
-        view_selected = set(layer._indices_view[: len(layer._view_data)])
-        layer.selected_data = new_selected
+        # Needed for the notification. View indices are unique and a subset
+        # of all point indices, so the invisible count is a difference of sizes
+        n_invis = n_data - len(layer._indices_view[: len(layer._view_data)])
+        # The setter copies into its own Selection, so don't build a set here
+        layer.selected_data = range(n_data)
+        n_total = len(layer.selected_data)
         show_info(
             trans._(
                 'Selected {n_new} points across all slices, including {n_invis} points not currently visible. ({n_total})',
-                n_new=len(new_selected),
-                n_invis=len(new_selected - view_selected),
-                n_total=len(layer.selected_data),
+                n_new=n_data,
+                n_invis=n_invis,
+                n_total=n_total,
                 deferred=True,
             )
         )
@@ -16,6 +16,18 @@ def test_modes(layer):
     assert layer.mode == 'pan_zoom'
 
 
+@pytest.mark.key_bindings
+def test_mode_to_fun(layer):
+    layer = Points([[1, 3], [8, 4]], size=1)
+
+    for mode, fun in key_bindings.points_mode_to_fun.items():
+        fun(layer)
+        assert layer.mode == mode
+    assert key_bindings.points_fun_to_mode == [
+        (fun, mode) for mode, fun in key_bindings.points_mode_to_fun.items()
+    ]
+
+
 @pytest.mark.key_bindings
 def test_copy_paste(layer):
     data = [[1, 3], [8, 4], [10, 10], [15, 4]]